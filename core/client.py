@@ -20,6 +20,9 @@ from rich.console import Console
 
 console = Console()
 
+# Successfully parsed configurations, keyed by filename.
+_config_cache: dict[str, tuple] = {}
+
 
 def load_config(filename: str = "config.ini") -> tuple | tuple:
     """
@@ -32,7 +35,13 @@ def load_config(filename: str = "config.ini") -> tuple | tuple:
     Returns:
         tuple: A tuple containing (api_id, api_hash, session_name) on success.
         tuple: A tuple containing (None, None, None) on failure.
+
+    Successful results are cached per filename, so later calls skip re-reading
+    and re-parsing the file. Failures are not cached and are retried.
     """
+    if filename in _config_cache:
+        return _config_cache[filename]
+
     config = configparser.ConfigParser()
     if not os.path.exists(filename):
         console.print(
@@ -42,14 +51,43 @@ def load_config(filename: str = "config.ini") -> tuple | tuple:
 
     config.read(filename)
     try:
-        api_id = config.getint("telegram_credentials", "api_id")
-        api_hash = config.get("telegram_credentials", "api_hash")
-        session_name = config.get("session_settings", "session_name")
+        # Read each section in one call instead of one lookup per option.
+        credentials = dict(config.items("telegram_credentials"))
+        session_settings = dict(config.items("session_settings"))
+        api_id = int(credentials["api_id"])
+        api_hash = credentials["api_hash"]
+        session_name = session_settings["session_name"]
+        _config_cache[filename] = (api_id, api_hash, session_name)
         return api_id, api_hash, session_name
-    except (configparser.NoSectionError, configparser.NoOptionError) as e:
+    except configparser.NoSectionError as e:
         # This block handles common errors from a malformed .ini file.
         console.print(f"[bold red]Error in configuration file: {e}[/bold red]")
         return None, None, None
+    except KeyError as e:
+        console.print(
+            f"[bold red]Error in configuration file: missing option {e}[/bold red]"
+        )
+        return None, None, None
+
+
+def tune_session_storage(session) -> None:
+    """
+    Applies faster SQLite pragmas to a file-backed Telethon session.
+
+    Telethon caches every resolved entity in the session database, so modules
+    that touch many peers write to it constantly. WAL journaling with
+    `synchronous=NORMAL` avoids an fsync on every one of those writes.
+
+    Args:
+        session: The client's session object. Sessions without an SQLite
+            connection (e.g. `StringSession`) are left untouched.
+    """
+    conn = getattr(session, "_conn", None)
+    if conn is None:
+        return
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
 
 
 async def get_client() -> TelegramClient | None:
@@ -69,6 +107,7 @@ async def get_client() -> TelegramClient | None:
         return None
 
     client = TelegramClient(session_name, api_id, api_hash)
+    tune_session_storage(client.session)
 
     try:
         await client.connect()
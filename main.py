@@ -6,7 +6,6 @@ This script serves as the central orchestrator for the Teleforge application.
 It is responsible for initializing the user interface, managing the main menu,
 and delegating execution to the functional modules based on user choice.
 """
-import os
 import asyncio
 from rich.console import Console
 from rich.panel import Panel
@@ -25,6 +24,7 @@ from modules.bulk_archiver import run as run_bulk_archiver
 from modules.chat_archiver import run as run_chat_archiver
 from modules.watermarker import run as run_watermarker
 from modules.service_message_cleaner import run as run_service_message_cleaner
+from utils.crypto_check import require_cryptg
 
 console = Console()
 
@@ -68,6 +68,9 @@ async def main():
     3. Calls the modules selected by the user.
     4. Ensures a safe disconnection upon exit.
     """
+    # Refuse to start on the slow encryption fallback.
+    require_cryptg()
+
     client = await get_client()
     if not client:
         # If the connection fails, the application cannot proceed.
@@ -89,7 +92,8 @@ async def main():
         }
         while True:
             # Clear the console screen for a cleaner interface on each menu cycle.
-            os.system("cls" if os.name == "nt" else "clear")
+            # Rich emits the ANSI escape directly instead of spawning a shell.
+            console.clear()
 
             display_banner()
             display_menu()
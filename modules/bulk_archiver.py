@@ -13,10 +13,45 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import IntPrompt, Prompt
 from rich.table import Table
+from telethon.errors.rpcerrorlist import FloodWaitError
 from telethon.sync import TelegramClient
+from telethon.tl.functions.folders import EditPeerFoldersRequest
+from telethon.tl.types import InputFolderPeer
+
+from utils.dialog_cache import get_dialogs_cached, invalidate_dialog_cache
 
 console = Console()
 
+# Telegram's folder ID for the "Archived Chats" folder.
+ARCHIVE_FOLDER_ID = 1
+# Number of peers moved per EditPeerFolders request.
+ARCHIVE_BATCH_SIZE = 100
+
+
+def muted_predicate(now: datetime):
+    """Returns a predicate matching dialogs that are muted as of `now`."""
+    # A future mute_until date means the chat is currently muted.
+    return lambda d: bool(
+        d.notify_settings
+        and d.notify_settings.mute_until
+        and d.notify_settings.mute_until > now
+    )
+
+
+def inactive_predicate(cutoff_date: datetime):
+    """Returns a predicate matching dialogs whose last message predates the cutoff."""
+    return lambda d: d.message is not None and d.message.date < cutoff_date
+
+
+def is_broadcast_channel(dialog) -> bool:
+    """Returns True for broadcast channels (megagroups count as groups)."""
+    return dialog.is_channel and not dialog.is_group
+
+
+def is_group(dialog) -> bool:
+    """Returns True for basic groups and megagroups."""
+    return dialog.is_group
+
 
 async def run(client: TelegramClient):
     """
@@ -27,7 +62,7 @@ async def run(client: TelegramClient):
     2. Fetching all user dialogs.
     3. Filtering the dialogs that match the selected rule.
     4. Displaying a preview of chats to be archived for user confirmation.
-    5. If confirmed, iterating through the list and archiving each chat.
+    5. If confirmed, moving the chats to the archive folder in batched requests.
     6. Reporting the final result.
 
     Args:
@@ -48,19 +83,12 @@ async def run(client: TelegramClient):
     )
 
     with console.status("[cyan]Fetching all your chats...[/cyan]"):
-        all_dialogs = await client.get_dialogs()
-
-    chats_to_archive = []
-    rule_description = ""
+        all_dialogs = await get_dialogs_cached(client)
 
-    # Apply the selected filter rule to the dialog list.
+    # Select the rule's predicate once, then filter the dialogs in a single pass.
     if choice == "1":
         rule_description = "Muted Chats"
-        for dialog in all_dialogs:
-            if dialog.notify_settings and dialog.notify_settings.mute_until:
-                # A future mute_until date means the chat is currently muted.
-                if dialog.notify_settings.mute_until > datetime.now(timezone.utc):
-                    chats_to_archive.append(dialog)
+        predicate = muted_predicate(datetime.now(timezone.utc))
 
     elif choice == "2":
         days = IntPrompt.ask(
@@ -68,22 +96,19 @@ async def run(client: TelegramClient):
             default=30,
         )
         rule_description = f"Chats inactive for {days} days"
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
-        for dialog in all_dialogs:
-            if dialog.message and dialog.message.date < cutoff_date:
-                chats_to_archive.append(dialog)
+        predicate = inactive_predicate(
+            datetime.now(timezone.utc) - timedelta(days=days)
+        )
 
     elif choice == "3":
         rule_description = "All Channels"
-        for dialog in all_dialogs:
-            if dialog.is_channel and not dialog.is_group:
-                chats_to_archive.append(dialog)
+        predicate = is_broadcast_channel
 
-    elif choice == "4":
+    else:
         rule_description = "All Groups"
-        for dialog in all_dialogs:
-            if dialog.is_group:
-                chats_to_archive.append(dialog)
+        predicate = is_group
+
+    chats_to_archive = [dialog for dialog in all_dialogs if predicate(dialog)]
 
     if not chats_to_archive:
         console.print(
@@ -116,15 +141,28 @@ async def run(client: TelegramClient):
         )
         == "y"
     ):
+        folder_peers = [
+            InputFolderPeer(peer=dialog.input_entity, folder_id=ARCHIVE_FOLDER_ID)
+            for dialog in chats_to_archive
+        ]
+
         with console.status(
             "[bold orange1]Archiving chats...[/bold orange1]"
         ) as status:
-            for i, dialog in enumerate(chats_to_archive):
+            # One EditPeerFolders request moves a whole batch of peers at once,
+            # instead of one round-trip per dialog.
+            for start in range(0, len(folder_peers), ARCHIVE_BATCH_SIZE):
+                batch = folder_peers[start : start + ARCHIVE_BATCH_SIZE]
                 status.update(
-                    f"Archiving '{dialog.name}' ({i+1}/{len(chats_to_archive)})"
+                    f"Archiving chats... ({start + len(batch)}/{len(folder_peers)})"
                 )
-                await dialog.archive()
-                await asyncio.sleep(0.1)
+                try:
+                    await client(EditPeerFoldersRequest(folder_peers=batch))
+                except FloodWaitError as e:
+                    await asyncio.sleep(e.seconds)
+                    await client(EditPeerFoldersRequest(folder_peers=batch))
+        # Archived dialogs moved folders, so the cached list is now stale.
+        invalidate_dialog_cache(client)
 
         console.print(
             f"\n[green]Successfully archived {len(chats_to_archive)} chats.[/green]"
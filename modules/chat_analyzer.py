@@ -12,6 +12,7 @@ from rich.panel import Panel
 from rich.progress import Progress
 from rich.prompt import IntPrompt
 from rich.table import Table
+from telethon import utils
 from telethon.sync import TelegramClient
 from telethon.tl.types import MessageMediaPhoto, MessageMediaDocument, User
 
@@ -19,6 +20,57 @@ from utils.chat_selector import select_chat
 
 console = Console()
 
+# Document MIME prefixes mapped to their media category. Both prefixes are six
+# characters long, so a single slice of the MIME type is used as the key.
+MIME_CATEGORIES = {"video/": "Videos", "audio/": "Audio Files"}
+
+# Number of messages processed between progress bar updates.
+PROGRESS_STEP = 128
+
+
+async def tally_users_by_name(
+    client: TelegramClient, counts_by_id: dict[int, int]
+) -> Counter:
+    """
+    Resolves sender IDs in one batch and aggregates their counts by first name.
+
+    Only human users are kept; bots and channels posting as senders are skipped.
+
+    Args:
+        client (TelegramClient): The active and connected Telethon client instance.
+        counts_by_id (dict[int, int]): Message counts keyed by sender ID.
+
+    Returns:
+        Counter: Message counts keyed by the user's display name.
+    """
+    user_activity = Counter()
+    # Users have positive IDs; negative ones are channels or chats.
+    user_ids = [sender_id for sender_id in counts_by_id if sender_id > 0]
+    if not user_ids:
+        return user_activity
+
+    # Resolve each ID to an InputPeer from the session cache only, which the
+    # message scan has just filled. Asking the network per missing ID would
+    # cost one request per sender, so unknown IDs are skipped instead.
+    input_peers = []
+    for user_id in user_ids:
+        try:
+            input_peers.append(
+                await utils.maybe_async(client.session.get_input_entity(user_id))
+            )
+        except ValueError:
+            continue
+    if not input_peers:
+        return user_activity
+
+    senders = await client.get_entity(input_peers)
+
+    for sender in senders:
+        if isinstance(sender, User) and not sender.bot:
+            user_name = sender.first_name or "Unknown User"
+            user_activity[user_name] += counts_by_id[sender.id]
+    return user_activity
+
 
 async def run(client: TelegramClient):
     """
@@ -52,38 +104,49 @@ async def run(client: TelegramClient):
         f"\n[cyan]Analyzing the last {limit_msgs} messages from '[bold]{target_chat.name}[/bold]'. This may take a moment...[/cyan]"
     )
 
-    user_activity = Counter()
+    # Messages are tallied by sender ID in a plain dict, which is cheaper to
+    # update per message than a Counter; names are resolved once at the end.
+    counts_by_id: dict[int, int] = {}
     media_activity = Counter()
 
     try:
         with Progress(console=console) as progress:
             task = progress.add_task("[green]Processing messages...", total=limit_msgs)
 
+            pending = 0
             async for message in client.iter_messages(target_chat, limit=limit_msgs):
-                progress.update(task, advance=1)
+                pending += 1
+                if pending == PROGRESS_STEP:
+                    progress.update(task, advance=pending)
+                    pending = 0
 
-                if (
-                    message.sender
-                    and isinstance(message.sender, User)
-                    and not message.sender.bot
-                ):
-                    user_name = message.sender.first_name or "Unknown User"
-                    user_activity[user_name] += 1
+                # `sender_id` never triggers an entity fetch, unlike `sender`.
+                sender_id = message.sender_id
+                if sender_id is not None:
+                    counts_by_id[sender_id] = counts_by_id.get(sender_id, 0) + 1
 
                 if message.media:
-                    if isinstance(message.media, MessageMediaPhoto):
+                    # Media classes are leaf TL types, so exact type checks suffice.
+                    media_type = type(message.media)
+                    if media_type is MessageMediaPhoto:
                         media_activity["Photos"] += 1
-                    elif isinstance(message.media, MessageMediaDocument):
-                        doc_mime_type = getattr(message.media.document, "mime_type", "")
-                        if doc_mime_type.startswith("video/"):
-                            media_activity["Videos"] += 1
-                        elif doc_mime_type.startswith("audio/"):
-                            media_activity["Audio Files"] += 1
-                        else:
-                            media_activity["Documents/Other"] += 1
+                    elif media_type is MessageMediaDocument:
+                        try:
+                            doc_mime_type = message.media.document.mime_type
+                        except AttributeError:
+                            # Expired documents arrive as DocumentEmpty (or None).
+                            doc_mime_type = ""
+                        category = MIME_CATEGORIES.get(
+                            doc_mime_type[:6], "Documents/Other"
+                        )
+                        media_activity[category] += 1
                     else:
                         media_activity["Other Media"] += 1
 
+            progress.update(task, advance=pending)
+
+        user_activity = await tally_users_by_name(client, counts_by_id)
+
         # Display the table of most active users
         console.print(
             f"\n[bold]--- Most Active Users (Last {limit_msgs} Msgs) ---[/bold]"
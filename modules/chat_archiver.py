@@ -17,6 +17,7 @@ from telethon.sync import TelegramClient
 from telethon.tl.types import Channel, User
 
 from utils.chat_selector import select_chat
+from utils.filenames import sanitize_filename
 
 console = Console()
 
@@ -69,9 +70,9 @@ async def run(client: TelegramClient):
     1. Selection of a target chat.
     2. Prompting for the export format (TXT or JSON).
     3. Prompting for the desired time period to archive.
-    4. Fetching all messages within the specified date range.
-    5. Writing the formatted messages to a local file.
-    6. Displaying a final summary report.
+    4. Fetching all messages within the specified date range and streaming
+       them to a local file as they arrive.
+    5. Displaying a final summary report.
 
     Args:
         client (TelegramClient): The active and connected Telethon client instance.
@@ -103,24 +104,25 @@ async def run(client: TelegramClient):
     start_date, end_date = get_date_range(date_choice)
 
     date_str = datetime.now().strftime("%Y-%m-%d")
-    sanitized_chat_name = "".join(
-        c for c in target_chat.name if c.isalnum() or c in (" ", "_")
-    ).rstrip()
+    sanitized_chat_name = sanitize_filename(target_chat.name)
     filename = f"Archive_{sanitized_chat_name}_{date_str}.{file_extension}"
     filepath = os.path.join(os.getcwd(), filename)
 
-    messages_to_write = []
     found_count = 0
 
     try:
         status_message = f"[cyan]Fetching messages from '[bold]{target_chat.name}[/bold]'... This may take a while.[/cyan]"
-        with console.status(status_message):
-            # We iterate backwards from the newest message (or from end_date if specified).
+        with open(filepath, "w", encoding="utf-8") as f, console.status(status_message):
+            if file_extension == "json":
+                f.write("[\n")
+
+            # Messages are delivered oldest-first, starting at start_date (or at
+            # the beginning of the chat), so both formats stream straight to disk.
             async for message in client.iter_messages(
-                target_chat, offset_date=end_date, limit=None
+                target_chat, offset_date=start_date, reverse=True, limit=None
             ):
-                # Stop iterating if we've gone past the start_date.
-                if start_date and message.date < start_date:
+                # Stop iterating once we've reached the end_date.
+                if end_date and message.date >= end_date:
                     break
 
                 sender_name = "N/A"
@@ -131,25 +133,27 @@ async def run(client: TelegramClient):
 
                 text = message.text or "[Media or other non-text content]"
 
-                messages_to_write.append(
-                    {
+                if file_extension == "json":
+                    if found_count:
+                        f.write(",\n")
+                    record = {
                         "timestamp": message.date.isoformat(),
                         "sender": sender_name,
                         "text": text,
                     }
-                )
+                    f.write("  " + json.dumps(record, ensure_ascii=False))
+                else:
+                    # Integer formatting skips strftime's format-string parsing,
+                    # which would otherwise run once per archived message.
+                    d = message.date
+                    display_ts = f"{d.year:04d}-{d.month:02d}-{d.day:02d} {d.hour:02d}:{d.minute:02d}"
+                    f.write(f"[{display_ts}] {sender_name}:\n")
+                    f.write(f"{text}\n")
+                    f.write("-" * 20 + "\n")
                 found_count += 1
 
-        with open(filepath, "w", encoding="utf-8") as f:
             if file_extension == "json":
-                json.dump(messages_to_write, f, indent=2, ensure_ascii=False)
-            else:
-                for msg in reversed(messages_to_write):
-                    f.write(
-                        f"[{datetime.fromisoformat(msg['timestamp']).strftime('%Y-%m-%d %H:%M')}] {msg['sender']}:\n"
-                    )
-                    f.write(f"{msg['text']}\n")
-                    f.write("-" * 20 + "\n")
+                f.write("\n]\n")
 
         summary = Panel(
             f"[bold]Archive complete![/bold]\nFound and saved [green]{found_count}[/green] messages.\n\nResults saved to:\n[yellow]{filepath}[/yellow]",
@@ -7,17 +7,65 @@ It helps clean up the contact list by identifying and offering to bulk-delete
 two types of contacts: accounts that have been deleted, and accounts that
 have been inactive for a user-defined period.
 """
-from datetime import datetime, timedelta
+import asyncio
+from datetime import datetime, timedelta, timezone
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import IntPrompt, Prompt
 from rich.table import Table
+from telethon import functions, utils
+from telethon.errors import RPCError
 from telethon.sync import TelegramClient
 from telethon.tl.types import UserStatusOffline
 
 console = Console()
 
+# Telegram caps how many peers a single contacts.deleteContacts call accepts.
+DELETE_CHUNK_SIZE = 100
+# Maximum number of delete requests in flight at the same time.
+MAX_CONCURRENT_DELETES = 3
+
+
+async def delete_contacts_chunked(client: TelegramClient, contacts: list) -> int:
+    """
+    Deletes contacts in fixed-size chunks, sending a few chunks concurrently.
+
+    A Telegram error (e.g. a FloodWaitError) only affects the chunk it
+    occurred in; any other exception is re-raised once all chunks finished.
+
+    Args:
+        client (TelegramClient): The active and connected Telethon client instance.
+        contacts (list): The users to remove from the contact list.
+
+    Returns:
+        int: The number of contacts that were successfully deleted.
+    """
+    chunks = [
+        contacts[i : i + DELETE_CHUNK_SIZE]
+        for i in range(0, len(contacts), DELETE_CHUNK_SIZE)
+    ]
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DELETES)
+
+    async def delete_chunk(chunk) -> int:
+        request = functions.contacts.DeleteContactsRequest(
+            id=[utils.get_input_user(user) for user in chunk]
+        )
+        async with semaphore:
+            try:
+                await client(request)
+            except RPCError:
+                return 0
+        return len(chunk)
+
+    results = await asyncio.gather(
+        *(delete_chunk(chunk) for chunk in chunks), return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return sum(results)
+
 
 async def run(client: TelegramClient):
     """
@@ -48,18 +96,25 @@ async def run(client: TelegramClient):
         "\n[bold]Consider contacts inactive if last seen more than how many months ago?[/bold]",
         default=6,
     )
-    cutoff_date = datetime.now() - timedelta(days=months * 30)
+    # Telethon returns timezone-aware datetimes, so the cutoff is kept aware too.
+    cutoff_date = datetime.now(timezone.utc) - timedelta(days=months * 30)
 
     deleted_contacts = []
     inactive_contacts = []
 
+    # Bind hot names locally; this loop can run over thousands of contacts.
+    add_deleted = deleted_contacts.append
+    add_inactive = inactive_contacts.append
+    offline_status = UserStatusOffline
+
     for user in contacts:
         if user.deleted:
-            deleted_contacts.append(user)
-        elif isinstance(user.status, UserStatusOffline):
-            # Convert timezone-aware datetime from Telethon to naive for comparison.
-            if user.status.was_online.replace(tzinfo=None) < cutoff_date:
-                inactive_contacts.append(user)
+            add_deleted(user)
+            continue
+        status = user.status
+        # UserStatusOffline is a leaf TL type, so an identity check is enough.
+        if status.__class__ is offline_status and status.was_online < cutoff_date:
+            add_inactive(user)
 
     if not deleted_contacts and not inactive_contacts:
         console.print(
@@ -105,10 +160,14 @@ async def run(client: TelegramClient):
         == "y"
     ):
         with console.status("[bold red]Deleting contacts...[/bold red]"):
-            result = await client.delete_contacts(contacts_to_delete)
-        if result:
+            deleted_count = await delete_contacts_chunked(client, contacts_to_delete)
+        if deleted_count == len(contacts_to_delete):
+            console.print(
+                f"\n[green]Successfully deleted {deleted_count} contacts.[/green]"
+            )
+        elif deleted_count:
             console.print(
-                f"\n[green]Successfully deleted {len(contacts_to_delete)} contacts.[/green]"
+                f"\n[yellow]Deleted {deleted_count} of {len(contacts_to_delete)} contacts. Some requests failed; try again later.[/yellow]"
             )
         else:
             console.print("\n[red]Failed to delete contacts.[/red]")
@@ -7,47 +7,174 @@ capabilities. It allows the user to select a chat and then apply filters
 to download only specific media types (photos, videos, etc.) and/or media
 sent by a specific user within that chat.
 """
+import asyncio
 import os
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import BarColumn, Progress, TextColumn, TimeRemainingColumn
-from rich.prompt import Prompt
+from rich.prompt import IntPrompt, Prompt
 from telethon.sync import TelegramClient
-from telethon.tl.types import MessageMediaDocument, MessageMediaPhoto, User
+from telethon.tl.types import (
+    InputMessagesFilterPhotos,
+    MessageMediaDocument,
+    MessageMediaPhoto,
+    User,
+)
 
 from utils.chat_selector import select_chat
+from utils.filenames import sanitize_filename
 
 console = Console()
 
+# Default number of concurrent downloads. Higher values overlap more network
+# latency but make Telegram flood limits more likely.
+DEFAULT_MAX_INFLIGHT = 4
+# Number of scanned messages between progress bar updates.
+PROGRESS_STEP = 128
 
-def check_media_type(message, media_filter: str) -> bool:
+
+# Menu choices mapped to the media filter they select.
+MEDIA_FILTER_MAP = {
+    "1": "all",
+    "2": "photos",
+    "3": "videos",
+    "4": "documents",
+    "5": "audio",
+}
+MEDIA_MENU = """
+[bold]Select a media type to download:[/bold]
+[cyan]1[/cyan] - All Media Types
+[cyan]2[/cyan] - Photos Only
+[cyan]3[/cyan] - Videos Only
+[cyan]4[/cyan] - Documents (PDF, ZIP, etc.)
+[cyan]5[/cyan] - Audio Files
+"""
+
+# MIME prefixes that have their own filters, so documents exclude them.
+AV_MIME_PREFIXES = ("video/", "audio/")
+
+
+def _mime_type(message) -> str:
+    """Returns the MIME type of a message's document, or an empty string."""
+    return getattr(message.media.document, "mime_type", "") or ""
+
+
+def _is_video(message) -> bool:
+    return _mime_type(message).startswith("video/")
+
+
+def _is_audio(message) -> bool:
+    return _mime_type(message).startswith("audio/")
+
+
+def _is_plain_document(message) -> bool:
+    return not _mime_type(message).startswith(AV_MIME_PREFIXES)
+
+
+# (filter, media class) pairs mapped to the check that decides a match. Pairs
+# that are not listed never match, so photos never count as documents, etc.
+MEDIA_CHECKS = {
+    ("photos", MessageMediaPhoto): lambda message: True,
+    ("videos", MessageMediaDocument): _is_video,
+    ("audio", MessageMediaDocument): _is_audio,
+    ("documents", MessageMediaDocument): _is_plain_document,
+}
+
+
+# Server-side search filters for each media filter, so Telegram only returns
+# candidate messages. A server filter can only remove messages, so only exact
+# equivalents are listed: the video filter skips GIFs and round video notes,
+# the document filter skips stickers and the music filter skips voice notes,
+# all of which the client-side checks above accept. Those media types are
+# therefore scanned in full and filtered client-side only.
+SERVER_FILTERS = {
+    "photos": InputMessagesFilterPhotos,
+}
+
+
+def build_message_predicate(media_filter: str):
     """
-    Helper function to check if a message's media matches the selected filter.
+    Builds a single predicate that decides whether a message should be downloaded.
+
+    The filters are fixed once the user has answered the prompts, so the
+    branching on them happens here, once, instead of for every scanned message.
+    The sender filter is applied server-side through `iter_messages(from_user=...)`.
 
     Args:
-        message: The Telethon message object.
         media_filter (str): The filter criteria ('all', 'photos', 'videos', etc.).
 
     Returns:
-        bool: True if the media type matches the filter, False otherwise.
+        Callable: A function taking a Telethon message and returning True if it
+        has media matching all of the selected filters.
     """
+    # Keep only the checks for the chosen filter, keyed by media class.
+    checks = {
+        media_class: check
+        for (name, media_class), check in MEDIA_CHECKS.items()
+        if name == media_filter
+    }
+
     if media_filter == "all":
-        return True
-    if media_filter == "photos":
-        return isinstance(message.media, MessageMediaPhoto)
-
-    if isinstance(message.media, MessageMediaDocument):
-        doc_mime_type = getattr(message.media.document, "mime_type", "")
-        if media_filter == "videos":
-            return doc_mime_type.startswith("video/")
-        if media_filter == "audio":
-            return doc_mime_type.startswith("audio/")
-        if media_filter == "documents":
-            return not doc_mime_type.startswith(
-                "video/"
-            ) and not doc_mime_type.startswith("audio/")
-    return False
+
+        def matches_media(message) -> bool:
+            return True
+
+    else:
+
+        def matches_media(message) -> bool:
+            check = checks.get(type(message.media))
+            return check is not None and check(message)
+
+    def predicate(message) -> bool:
+        if not message.media or getattr(message, "service", False):
+            return False
+        return matches_media(message)
+
+    return predicate
+
+
+def _unique_path(file_path: str) -> str:
+    """
+    Returns `file_path`, or a "name (n).ext" variant of it if it already exists.
+
+    Args:
+        file_path (str): The preferred path for the file.
+
+    Returns:
+        str: A path that doesn't exist yet.
+    """
+    root, ext = os.path.splitext(file_path)
+    candidate, counter = file_path, 1
+    while os.path.exists(candidate):
+        candidate = f"{root} ({counter}){ext}"
+        counter += 1
+    return candidate
+
+
+async def download_message_media(message, download_path: str) -> str | None:
+    """
+    Downloads a message's media into a folder.
+
+    Args:
+        message: The Telethon message object holding the media.
+        download_path (str): The folder where the file will be saved.
+
+    Returns:
+        str | None: The path of the saved file, or None if nothing was downloaded.
+    """
+    if message.file is None:
+        return await message.download_media(file=download_path)
+
+    # The message ID prefix keeps files with the same name (or photos taken in
+    # the same second) from overwriting each other when several downloads run
+    # at once; existing files from earlier runs are kept as well.
+    name = message.file.name
+    filename = (
+        f"{message.id}_{name}" if name else f"{message.id}{message.file.ext or ''}"
+    )
+    file_path = _unique_path(os.path.join(download_path, filename))
+    return await message.download_media(file=file_path)
 
 
 async def run(client: TelegramClient):
@@ -58,7 +185,8 @@ async def run(client: TelegramClient):
     1. Selection of a target chat.
     2. Prompting the user to select media type and user filters.
     3. Iterating through all messages while applying the selected filters.
-    4. Downloading only the messages that match the criteria.
+    4. Downloading the matching messages through a bounded pool of
+       concurrent downloads.
     5. Displaying a final report.
 
     Args:
@@ -71,24 +199,11 @@ async def run(client: TelegramClient):
     if not target_chat:
         return
 
-    console.print("\n[bold]Select a media type to download:[/bold]")
-    console.print("[cyan]1[/cyan] - All Media Types")
-    console.print("[cyan]2[/cyan] - Photos Only")
-    console.print("[cyan]3[/cyan] - Videos Only")
-    console.print("[cyan]4[/cyan] - Documents (PDF, ZIP, etc.)")
-    console.print("[cyan]5[/cyan] - Audio Files")
-
+    console.print(MEDIA_MENU)
     media_choice = Prompt.ask(
-        "Enter your choice", choices=["1", "2", "3", "4", "5"], default="1"
+        "Enter your choice", choices=list(MEDIA_FILTER_MAP), default="1"
     )
-    media_filter_map = {
-        "1": "all",
-        "2": "photos",
-        "3": "videos",
-        "4": "documents",
-        "5": "audio",
-    }
-    media_filter = media_filter_map[media_choice]
+    media_filter = MEDIA_FILTER_MAP[media_choice]
 
     user_filter_id = None
     if (
@@ -118,10 +233,14 @@ async def run(client: TelegramClient):
                 "[red]Invalid user selection. Proceeding without user filter.[/red]"
             )
 
+    max_inflight = IntPrompt.ask(
+        "\n[bold]How many files should be downloaded at the same time?[/bold]",
+        default=DEFAULT_MAX_INFLIGHT,
+    )
+    max_inflight = max(1, max_inflight)
+
     main_download_folder = "downloads"
-    sanitized_chat_name = "".join(
-        c for c in target_chat.name if c.isalnum() or c in (" ", "_")
-    ).rstrip()
+    sanitized_chat_name = sanitize_filename(target_chat.name)
     download_path = os.path.join(os.getcwd(), main_download_folder, sanitized_chat_name)
     os.makedirs(download_path, exist_ok=True)
 
@@ -131,14 +250,40 @@ async def run(client: TelegramClient):
     console.print(f"Files will be saved in: [yellow]{download_path}[/yellow]")
 
     try:
-        total_messages_count = (await client.get_messages(target_chat, limit=0)).total
+        server_filter = SERVER_FILTERS.get(media_filter)
+        search_options = {
+            "filter": server_filter() if server_filter else None,
+            "from_user": user_filter_id,
+        }
+        total_messages_count = (
+            await client.get_messages(target_chat, limit=0, **search_options)
+        ).total
         if total_messages_count == 0:
             console.print(
                 "[yellow]The chat has no messages. Nothing to download.[/yellow]"
             )
             return
 
+        should_download = build_message_predicate(media_filter)
         downloaded_files = 0
+        pending: set[asyncio.Task] = set()
+
+        def collect(done: set[asyncio.Task]):
+            """Counts finished downloads and reports the ones that failed."""
+            nonlocal downloaded_files
+            for finished in done:
+                try:
+                    file_path = finished.result()
+                except Exception as e:
+                    console.print(f"[red]\nError downloading a file: {e}[/red]")
+                    continue
+                if file_path:
+                    downloaded_files += 1
+                    progress.update(
+                        task,
+                        description=f"[green]Downloading... ({downloaded_files} saved)[/green]",
+                    )
+
         with Progress(
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
@@ -151,29 +296,41 @@ async def run(client: TelegramClient):
                 "[green]Scanning messages...", total=total_messages_count
             )
 
-            async for message in client.iter_messages(target_chat):
-                progress.update(task, advance=1)
-
-                # Apply all selected filters before deciding to download.
-                should_download = message.media and not getattr(
-                    message, "service", False
-                )
-                if should_download and user_filter_id:
-                    should_download = message.sender_id == user_filter_id
-                if should_download:
-                    should_download = check_media_type(message, media_filter)
-
-                if should_download:
-                    try:
-                        file_path = await message.download_media(file=download_path)
-                        if file_path:
-                            downloaded_files += 1
-                            progress.update(
-                                task,
-                                description=f"[green]Downloading... ({downloaded_files} saved)[/green]",
+            try:
+                unreported = 0
+                async for message in client.iter_messages(
+                    target_chat, **search_options
+                ):
+                    unreported += 1
+                    if unreported == PROGRESS_STEP:
+                        progress.update(task, advance=unreported)
+                        unreported = 0
+
+                    # Apply all selected filters before deciding to download.
+                    if should_download(message):
+                        # Downloads run in the background while the scan continues;
+                        # once the pool is full, wait for at least one to finish.
+                        pending.add(
+                            asyncio.create_task(
+                                download_message_media(message, download_path)
+                            )
+                        )
+                        if len(pending) >= max_inflight:
+                            done, pending = await asyncio.wait(
+                                pending, return_when=asyncio.FIRST_COMPLETED
                             )
-                    except Exception as e:
-                        console.print(f"[red]\nError downloading a file: {e}[/red]")
+                            collect(done)
+
+                progress.update(task, advance=unreported)
+                if pending:
+                    done, _ = await asyncio.wait(pending)
+                    collect(done)
+            finally:
+                # If the scan failed, stop the downloads still in flight
+                # instead of leaving them running after the error is shown.
+                for download in pending:
+                    download.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
 
         console.print(f"\n\n[bold green]--- Process Complete ---[/bold green]")
         console.print(f"Total media files downloaded: [bold]{downloaded_files}[/bold]")
@@ -18,6 +18,21 @@ from telethon.tl.types import Channel, User
 
 console = Console()
 
+# Write buffer for the results file. A long search produces many small
+# records, so a large buffer keeps the number of write syscalls low.
+RESULTS_BUFFER_SIZE = 1024 * 1024
+
+# Layout of the results file, filled in with a single format pass per record.
+HEADER_TEMPLATE = "--- Search Results for '{keyword}' ---\n\n"
+RECORD_TEMPLATE = (
+    "----------------------------------------\n"
+    "Chat: {chat_title} (ID: {chat_id})\n"
+    "From: {sender}\n"
+    "Date: {date}\n"
+    "Link: {link}\n"
+    "Text: {text}\n\n"
+)
+
 
 async def run(client: TelegramClient):
     """
@@ -42,14 +57,14 @@ async def run(client: TelegramClient):
         console.print("[red]Search term cannot be empty.[/red]")
         return
 
-    date_str = datetime.now().strftime("%Y-%m-%d_%H-%M")
+    date_str = f"{datetime.now():%Y-%m-%d_%H-%M}"
     filename = f"Global_Search_{keyword.replace(' ', '_')}_{date_str}.txt"
     filepath = os.path.join(os.getcwd(), filename)
 
     found_count = 0
     try:
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(f"--- Search Results for '{keyword}' ---\n\n")
+        with open(filepath, "w", encoding="utf-8", buffering=RESULTS_BUFFER_SIZE) as f:
+            f.write(HEADER_TEMPLATE.format(keyword=keyword))
 
             status_message = (
                 "[cyan]Searching across all chats... This can take a long time.[/cyan]"
@@ -73,12 +88,16 @@ async def run(client: TelegramClient):
                     # Note: These links work best for public/private channels and supergroups.
                     message_link = f"https://t.me/c/{message.chat_id}/{message.id}"
 
-                    f.write("----------------------------------------\n")
-                    f.write(f"Chat: {chat_title} (ID: {message.chat_id})\n")
-                    f.write(f"From: {sender_name}\n")
-                    f.write(f"Date: {message.date.strftime('%Y-%m-%d %H:%M')}\n")
-                    f.write(f"Link: {message_link}\n")
-                    f.write(f"Text: {message.text}\n\n")
+                    f.write(
+                        RECORD_TEMPLATE.format(
+                            chat_title=chat_title,
+                            chat_id=message.chat_id,
+                            sender=sender_name,
+                            date=format(message.date, "%Y-%m-%d %H:%M"),
+                            link=message_link,
+                            text=message.text,
+                        )
+                    )
 
                     found_count += 1
 
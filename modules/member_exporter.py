@@ -8,6 +8,7 @@ members, and saves their details to a CSV. It also intelligently warns the
 user if the fetched member list is incomplete due to Telegram's API
 privacy restrictions for non-admins in large groups.
 """
+import asyncio
 import csv
 import os
 from datetime import datetime
@@ -15,23 +16,39 @@ from telethon.sync import TelegramClient
 from telethon.tl.types import UserStatusOnline, UserStatusOffline, UserStatusRecently
 from rich.console import Console
 from rich.panel import Panel
+from rich.progress import Progress
 
 from utils.chat_selector import select_chat
+from utils.filenames import sanitize_filename
 
 console = Console()
 
+# Write buffer for the CSV export, sized to keep write syscalls to a minimum.
+CSV_BUFFER_SIZE = 1024 * 1024
+# Rows handed to csv.writer.writerows() at a time while streaming the export.
+CSV_ROWS_PER_WRITE = 200
+# Number of fetched members between progress bar updates.
+PROGRESS_STEP = 128
+
+
+# Status classes mapped to their formatter. Looking up the exact type is a
+# single hash lookup, rather than a chain of isinstance checks per user.
+STATUS_FORMATTERS = {
+    UserStatusOnline: lambda status: "Online",
+    UserStatusOffline: lambda status: f"Last seen on {status.was_online:%Y-%m-%d %H:%M}",
+    UserStatusRecently: lambda status: "Seen recently",
+}
+
+
+def _untracked_status(status) -> str:
+    return "Untracked Status"
+
 
 def get_user_status(user) -> str:
     """Returns a formatted string for the user's status."""
     if user.status is None:
         return "Unknown"
-    if isinstance(user.status, UserStatusOnline):
-        return "Online"
-    if isinstance(user.status, UserStatusOffline):
-        return f"Last seen on {user.status.was_online.strftime('%Y-%m-%d %H:%M')}"
-    if isinstance(user.status, UserStatusRecently):
-        return "Seen recently"
-    return "Untracked Status"
+    return STATUS_FORMATTERS.get(type(user.status), _untracked_status)(user.status)
 
 
 async def run(client: TelegramClient):
@@ -40,10 +57,10 @@ async def run(client: TelegramClient):
 
     The workflow includes:
     1. Selection of a target group.
-    2. Collection of all available members (filtering out bots and deleted accounts).
-    3. Creation of a CSV file named after the group and current date.
-    4. Writing member data (ID, Username, Name, Status) to the file.
-    5. Displaying a final report with the path to the saved file.
+    2. Creation of a CSV file named after the group and current date.
+    3. Streaming all available members (filtering out bots and deleted accounts)
+       straight into the file (ID, Username, Name, Status) as they are fetched.
+    4. Displaying a final report with the path to the saved file.
 
     Args:
         client (TelegramClient): The active and connected Telethon client instance.
@@ -59,64 +76,79 @@ async def run(client: TelegramClient):
 
     total_known_members = target_group.entity.participants_count
 
-    with console.status(
-        f"[cyan]Collecting members from group '[bold]{target_group.name}[/bold]'...[/cyan]"
-    ):
-        all_participants = [
-            user
-            async for user in client.iter_participants(target_group.entity)
-            if not user.bot and not user.deleted
-        ]
-
-    fetched_count = len(all_participants)
-
-    if fetched_count < total_known_members:
-        warning_panel = Panel(
-            f"[bold]Telegram returned only [yellow]{fetched_count}[/yellow] of [yellow]{total_known_members}[/yellow] known members.[/bold]\n\n"
-            "This usually happens due to privacy restrictions in large groups where you are not an administrator. Only the partial list will be exported.",
-            title="[bold red]WARNING: Incomplete Member List[/bold red]",
-            border_style="red",
-        )
-        console.print(warning_panel)
-
-    if not all_participants:
-        console.print("[red]Could not find any members in this group.[/red]")
-        return
-
-    date_str = datetime.now().strftime("%Y-%m-%d")
-    sanitized_group_name = "".join(
-        c for c in target_group.name if c.isalnum() or c in (" ", "_")
-    ).rstrip()
+    date_str = f"{datetime.now():%Y-%m-%d}"
+    sanitized_group_name = sanitize_filename(target_group.name)
     filename = f"Members_{sanitized_group_name}_{date_str}.csv"
     filepath = os.path.join(os.getcwd(), filename)
 
-    console.print(
-        f"\n[cyan]Exporting [bold]{len(all_participants)}[/bold] members to file: [yellow]{filename}[/yellow]"
-    )
+    console.print(f"\n[cyan]Exporting members to file: [yellow]{filename}[/yellow]")
 
+    fetched_count = 0
     try:
-        with open(filepath, "w", newline="", encoding="utf-8") as f:
+        with open(
+            filepath, "w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE
+        ) as f, Progress(console=console) as progress:
+            # Progress tracks every member Telegram returns, so it fills up as
+            # the API pages arrive instead of after the whole list is fetched.
+            task = progress.add_task(
+                f"[cyan]Exporting members from '{target_group.name}'...",
+                total=total_known_members,
+            )
             writer = csv.writer(f)
             writer.writerow(
                 ["User ID", "Username", "First Name", "Last Name", "Status"]
             )
-
-            for user in all_participants:
-                status = get_user_status(user)
-                writer.writerow(
-                    [
+            # Members are written as they arrive instead of being collected into
+            # a list first. Rows are grouped so each writerows() call still
+            # handles a whole batch inside the C writer.
+            rows = []
+            unreported = 0
+            async for user in client.iter_participants(target_group.entity):
+                unreported += 1
+                if unreported == PROGRESS_STEP:
+                    progress.update(task, advance=unreported)
+                    unreported = 0
+                if user.bot or user.deleted:
+                    continue
+                rows.append(
+                    (
                         user.id,
                         user.username or "",
                         user.first_name or "",
                         user.last_name or "",
-                        status,
-                    ]
+                        get_user_status(user),
+                    )
                 )
-
-        console.print(f"\n[bold green]--- Export Complete ---[/bold green]")
-        console.print(f"Data successfully saved to: [bold]{filepath}[/bold]")
+                fetched_count += 1
+                if len(rows) == CSV_ROWS_PER_WRITE:
+                    # Serializing and flushing happen in a worker thread so the
+                    # event loop keeps serving Telethon while the disk catches up.
+                    await asyncio.to_thread(writer.writerows, rows)
+                    rows = []
+            progress.update(task, advance=unreported)
+            await asyncio.to_thread(writer.writerows, rows)
 
     except Exception as e:
         console.print(
-            f"\n[bold red]An error occurred while writing the CSV file: {e}[/bold red]"
+            f"\n[bold red]An error occurred while exporting the members: {e}[/bold red]"
+        )
+        return
+
+    if not fetched_count:
+        os.remove(filepath)
+        console.print("[red]Could not find any members in this group.[/red]")
+        return
+
+    if fetched_count < total_known_members:
+        warning_panel = Panel(
+            f"[bold]Telegram returned only [yellow]{fetched_count}[/yellow] of [yellow]{total_known_members}[/yellow] known members.[/bold]\n\n"
+            "This usually happens due to privacy restrictions in large groups where you are not an administrator. Only the partial list was exported.",
+            title="[bold red]WARNING: Incomplete Member List[/bold red]",
+            border_style="red",
         )
+        console.print(warning_panel)
+
+    console.print(f"\n[bold green]--- Export Complete ---[/bold green]")
+    console.print(
+        f"[bold]{fetched_count}[/bold] members successfully saved to: [bold]{filepath}[/bold]"
+    )
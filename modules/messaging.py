@@ -16,12 +16,84 @@ from telethon.sync import TelegramClient
 from telethon.errors.rpcerrorlist import PeerFloodError, UserPrivacyRestrictedError
 from rich.console import Console
 from rich.panel import Panel
+from rich.progress import Progress
 from rich.prompt import Prompt, IntPrompt
 
 from utils.chat_selector import select_chat
 
 console = Console()
 
+# Number of fetched members between progress callbacks.
+PROGRESS_STEP = 128
+
+
+def next_send_delay(streak: int, last_send_failed: bool) -> int:
+    """
+    Picks the safety delay (in seconds) before the next message.
+
+    The window narrows as consecutive sends succeed, down to a fixed floor,
+    and widens to a longer cool-down right after any failure.
+
+    Args:
+        streak (int): The number of consecutive successful sends.
+        last_send_failed (bool): Whether the most recent send raised an error.
+
+    Returns:
+        int: The number of seconds to wait.
+    """
+    if last_send_failed:
+        return random.randint(60, 120)
+    return random.randint(max(15, 45 - streak), max(30, 90 - 2 * streak))
+
+
+async def sample_members(
+    client: TelegramClient, group, amount: int, on_progress=None
+) -> tuple[list, int]:
+    """
+    Picks a uniform random sample of a group's members in a single pass.
+
+    Uses reservoir sampling (Algorithm R) over the participant iterator, so
+    only `amount` users are kept in memory regardless of the group's size.
+    Bots and deleted accounts are skipped.
+
+    Args:
+        client (TelegramClient): The active and connected Telethon client instance.
+        group: The group entity whose members will be sampled.
+        amount (int): The maximum number of members to pick.
+        on_progress (Callable, optional): Called with the number of members
+            Telegram returned since the previous call, every `PROGRESS_STEP`
+            members and once at the end, e.g. to advance a progress bar.
+
+    Returns:
+        tuple[list, int]: The sampled users in random order, and the total
+        number of eligible members that were seen.
+    """
+    reservoir = []
+    seen = 0
+    unreported = 0
+    async for user in client.iter_participants(group):
+        unreported += 1
+        if unreported == PROGRESS_STEP:
+            if on_progress:
+                on_progress(unreported)
+            unreported = 0
+        if user.bot or user.deleted:
+            continue
+        if seen < amount:
+            reservoir.append(user)
+        else:
+            # Replace a kept member with probability amount / (seen + 1).
+            slot = random.randint(0, seen)
+            if slot < amount:
+                reservoir[slot] = user
+        seen += 1
+    if on_progress:
+        on_progress(unreported)
+
+    # The reservoir is only partially shuffled by the replacement step.
+    random.shuffle(reservoir)
+    return reservoir, seen
+
 
 async def run(client: TelegramClient):
     """
@@ -30,9 +102,10 @@ async def run(client: TelegramClient):
     The workflow includes:
     1. Displaying a security warning and asking for confirmation.
     2. Selection of a target group.
-    3. Collection of all available members (filtering bots and deleted accounts).
-    4. Prompting for the message content and the number of recipients.
-    5. Sending messages to a random sample of members, with a significant,
+    3. Prompting for the message content and the number of recipients.
+    4. Sampling that many random members while scanning the member list
+       (filtering bots and deleted accounts), without keeping the full list.
+    5. Sending messages to the sampled members, with a significant,
        random safety delay between each send.
     6. Handling common errors and providing a final report.
 
@@ -68,16 +141,31 @@ async def run(client: TelegramClient):
 
     total_known_members = target_group.entity.participants_count
 
-    with console.status(
-        f"[cyan]Collecting members from group '[bold]{target_group.name}[/bold]'...[/cyan]"
-    ):
-        all_participants = [
-            user
-            async for user in client.iter_participants(target_group.entity)
-            if not user.bot and not user.deleted
-        ]
+    console.print(
+        "\n[bold]Enter the message you want to send. To create a new line, use '\\n'.[/bold]"
+    )
+    message_to_send = Prompt.ask("> ").replace("\\n", "\n")
+
+    amount = IntPrompt.ask(
+        f"\n[bold]How many (random) members do you want to message? (known members: {total_known_members})[/bold]",
+        default=1,
+    )
+    if amount <= 0:
+        console.print("[red]Invalid value.[/red]")
+        return
+
+    with Progress(console=console) as progress:
+        task = progress.add_task(
+            f"[cyan]Collecting members from '{target_group.name}'...",
+            total=total_known_members,
+        )
+        members_to_message, fetched_count = await sample_members(
+            client,
+            target_group.entity,
+            amount,
+            on_progress=lambda count: progress.update(task, advance=count),
+        )
 
-    fetched_count = len(all_participants)
     console.print(
         f"[green]Total members found: [bold]{fetched_count}[/bold] (out of {total_known_members} known)[/green]"
     )
@@ -90,29 +178,22 @@ async def run(client: TelegramClient):
             )
         )
 
-    if not all_participants:
+    if not members_to_message:
         console.print("[red]No members found to send messages to.[/red]")
         return
 
-    console.print(
-        "\n[bold]Enter the message you want to send. To create a new line, use '\\n'.[/bold]"
-    )
-    message_to_send = Prompt.ask("> ").replace("\\n", "\n")
-
-    amount = IntPrompt.ask(
-        f"\n[bold]How many (random) members do you want to message? (max: {fetched_count})[/bold]",
-        default=1,
-    )
-    if not (0 < amount <= fetched_count):
-        console.print("[red]Invalid value.[/red]")
-        return
-
-    members_to_message = random.sample(all_participants, amount)
+    if amount > fetched_count:
+        console.print(
+            f"[yellow]Only {fetched_count} members are available; all of them will be messaged.[/yellow]"
+        )
+        amount = fetched_count
 
     console.print(
         f"\n[cyan]Starting to send messages to [bold]{len(members_to_message)}[/bold] member(s).[/cyan]"
     )
     success, failure = 0, 0
+    # Consecutive successful sends, used to shorten the safety delay over time.
+    streak, last_send_failed = 0, False
 
     for i, member in enumerate(members_to_message):
         try:
@@ -122,11 +203,14 @@ async def run(client: TelegramClient):
             await client.send_message(member.id, message_to_send)
             console.print("  [green] -> Message sent successfully.[/green]")
             success += 1
+            streak += 1
+            last_send_failed = False
         except UserPrivacyRestrictedError:
             console.print(
                 "  [yellow] -> Failed: User's privacy settings do not allow DMs.[/yellow]"
             )
             failure += 1
+            streak, last_send_failed = 0, True
         except PeerFloodError:
             console.print(
                 "[bold red]!!! PEER FLOOD ERROR DETECTED BY TELEGRAM !!![/bold red]"
@@ -139,9 +223,10 @@ async def run(client: TelegramClient):
         except Exception as e:
             console.print(f"  [red] -> Failed to send: {e}[/red]")
             failure += 1
+            streak, last_send_failed = 0, True
 
         if i < amount - 1:
-            delay = random.randint(45, 90)
+            delay = next_send_delay(streak, last_send_failed)
             with console.status(
                 f"[dim]Waiting {delay}s to avoid flood...[/dim]", spinner="dots"
             ):
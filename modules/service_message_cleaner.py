@@ -7,6 +7,7 @@ chats by removing service messages. These messages, such as user join/leave
 notifications, can clutter a chat over time. This tool automates the
 process of finding and deleting them in bulk.
 """
+import array
 import asyncio
 
 from rich.console import Console
@@ -19,6 +20,15 @@ from utils.chat_selector import select_chat
 
 console = Console()
 
+# Maximum number of delete requests in flight while the scan continues.
+MAX_CONCURRENT_DELETES = 3
+# Message IDs collected before a delete is issued. Telethon splits larger
+# batches into API-sized chunks itself, so fewer, bigger batches mean fewer
+# waits between requests.
+DELETE_BATCH_SIZE = 500
+# Number of scanned messages between progress bar updates.
+PROGRESS_STEP = 128
+
 
 async def run(client: TelegramClient):
     """
@@ -29,7 +39,8 @@ async def run(client: TelegramClient):
     2. A critical confirmation prompt, as deletion is irreversible.
     3. Iterating through the entire message history to find service messages.
     4. Collecting message IDs into batches.
-    5. Deleting messages in batches of 100 for API efficiency.
+    5. Deleting messages in large batches in the background while the scan
+       continues.
     6. Displaying a final report of the total messages deleted.
 
     Args:
@@ -72,7 +83,25 @@ async def run(client: TelegramClient):
         return
 
     deleted_count = 0
-    ids_to_delete = []
+    # Message IDs are stored unboxed as C int64 values until a batch is flushed.
+    ids_to_delete = array.array("q")
+    delete_semaphore = asyncio.Semaphore(MAX_CONCURRENT_DELETES)
+    pending: set[asyncio.Task] = set()
+
+    async def flush(ids: list[int]):
+        """Deletes one batch of messages, throttled by the shared semaphore."""
+        nonlocal deleted_count
+        async with delete_semaphore:
+            await client.delete_messages(target_chat, ids)
+            deleted_count += len(ids)
+            # Pause in proportion to the batch size to stay under flood limits.
+            await asyncio.sleep(0.2 + 0.01 * len(ids))
+
+    def prune():
+        """Drops finished batches, re-raising the first failure, if any."""
+        for finished in [t for t in pending if t.done()]:
+            pending.discard(finished)
+            finished.result()
 
     try:
         total_messages_count = (await client.get_messages(target_chat, limit=0)).total
@@ -82,35 +111,44 @@ async def run(client: TelegramClient):
                 "[green]Scanning messages...", total=total_messages_count
             )
 
-            async for message in client.iter_messages(target_chat):
-                progress.update(task, advance=1)
-
-                # The `message.service` attribute is True only for system notifications.
-                if message.service:
-                    ids_to_delete.append(message.id)
+            try:
+                unreported = 0
+                async for message in client.iter_messages(target_chat):
+                    unreported += 1
+                    if unreported == PROGRESS_STEP:
+                        progress.update(task, advance=unreported)
+                        unreported = 0
 
-                    # Delete in batches of 100 for maximum API efficiency.
-                    if getattr(message, "service", False):
+                    # The `message.service` attribute is True only for system notifications.
+                    if message.service:
                         ids_to_delete.append(message.id)
 
-                        if len(ids_to_delete) == 100:
+                        # Batches are deleted in the background so the scan keeps going.
+                        if len(ids_to_delete) == DELETE_BATCH_SIZE:
                             progress.update(
                                 task,
-                                description=f"[magenta]Deleting a batch of {len(ids_to_delete)} messages...[/magenta]",
+                                description=f"[magenta]Scanning... ({deleted_count} deleted so far)[/magenta]",
                             )
-                            await client.delete_messages(target_chat, ids_to_delete)
-                            deleted_count += len(ids_to_delete)
-                            ids_to_delete = []
-                            await asyncio.sleep(1)
-
-            # Delete any remaining messages after the loop finishes.
-            if ids_to_delete:
-                progress.update(
-                    task,
-                    description=f"[magenta]Deleting the final batch of {len(ids_to_delete)} messages...[/magenta]",
-                )
-                await client.delete_messages(target_chat, ids_to_delete)
-                deleted_count += len(ids_to_delete)
+                            pending.add(asyncio.create_task(flush(list(ids_to_delete))))
+                            del ids_to_delete[:]
+                            prune()
+
+                progress.update(task, advance=unreported)
+                # Delete any remaining messages after the loop finishes.
+                if ids_to_delete:
+                    pending.add(asyncio.create_task(flush(list(ids_to_delete))))
+                if pending:
+                    progress.update(
+                        task,
+                        description="[magenta]Waiting for the remaining deletions...[/magenta]",
+                    )
+                    await asyncio.gather(*pending)
+            finally:
+                # Stop any batch still running if the scan or a deletion
+                # failed, so nothing is deleted after the error is reported.
+                for batch in pending:
+                    batch.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
 
         summary = Panel(
             f"[bold]Cleaning complete![/bold]\nSuccessfully deleted [green]{deleted_count}[/green] service messages from the chat.",
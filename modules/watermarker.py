@@ -7,8 +7,14 @@ watermark to a batch of images and upload them directly to a Telegram chat.
 It supports both image-based (e.g., a logo) and text-based watermarks,
 offering customization options for position, scale, and opacity.
 """
+import asyncio
+import functools
 import io
+import math
+import multiprocessing
 import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
 from PIL import Image, ImageDraw, ImageFont
@@ -22,6 +28,41 @@ from utils.chat_selector import select_chat
 
 console = Console()
 
+# PyTurboJPEG calls libjpeg-turbo's encoder directly and skips Pillow's
+# encoder setup. It is optional: either the binding or the native library may
+# be missing, in which case Pillow's own JPEG encoder is used.
+try:
+    import numpy as np
+    from turbojpeg import TJPF_RGB, TJSAMP_420, TurboJPEG
+
+    _turbo_jpeg = TurboJPEG()
+except (ImportError, OSError):
+    _turbo_jpeg = None
+
+# Quality used for the uploaded JPEGs. Telegram recompresses photos anyway,
+# so anything above this only costs encode time and upload bytes.
+JPEG_QUALITY = 85
+
+# Telegram shows photos at up to 2560px on the long side, so larger sources
+# are downscaled before compositing and encoding by default.
+DEFAULT_MAX_DIMENSION = 2560
+
+# Per-thread scratch buffer that Pillow encodes into. It keeps its grown
+# capacity between images, so each encode doesn't regrow a fresh buffer.
+_encode_buffers = threading.local()
+
+# Telegram albums hold at most 10 photos; finished images are sent in groups
+# of this size to save a request round-trip per image.
+ALBUM_SIZE = 10
+
+# Batches with at least this many files per CPU are processed in separate
+# processes instead of threads. Worker start-up and pickling the encoded
+# images only pay off once there is enough work to spread across cores.
+PROCESS_POOL_FILES_PER_WORKER = 2
+
+# Source file extensions picked up from the folder (compared lowercased).
+IMAGE_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg"})
+
 try:
     PROJECT_ROOT = Path(__file__).resolve().parent.parent
     FONT_PATH = PROJECT_ROOT / "assets" / "fonts" / "arial.ttf"
@@ -36,6 +77,9 @@ def create_text_watermark_image(
     """
     Creates an in-memory Pillow Image of a text watermark.
 
+    The rendered watermark only depends on the image width, so images of the
+    same width share one cached render. Callers must not modify the result.
+
     Args:
         text (str): The text content of the watermark.
         size (tuple): The (width, height) of the base image to scale against.
@@ -46,9 +90,23 @@ def create_text_watermark_image(
     Returns:
         Image.Image | None: A Pillow Image object of the rendered text, or None on error.
     """
+    return _render_text_watermark(text, size[0], font_path, opacity, scale)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_font(font_path: str, font_size: int) -> ImageFont.FreeTypeFont:
+    """Loads and parses a font file once per size."""
+    return ImageFont.truetype(font_path, font_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _render_text_watermark(
+    text: str, width: int, font_path: str, opacity: int, scale: float
+) -> Image.Image | None:
+    """Renders the text watermark for a given base image width."""
     try:
-        font_size = int((size[0] * (scale / 100)) / len(text) * 1.8)
-        font = ImageFont.truetype(font_path, font_size)
+        font_size = int((width * (scale / 100)) / len(text) * 1.8)
+        font = _load_font(font_path, font_size)
 
         temp_draw = ImageDraw.Draw(Image.new("RGBA", (0, 0)))
         text_bbox = temp_draw.textbbox((0, 0), text, font=font)
@@ -87,42 +145,160 @@ def create_text_watermark_image(
         return None
 
 
+@functools.lru_cache(maxsize=None)
+def _opacity_lut(opacity: int) -> list[int]:
+    """Builds the 256-entry alpha lookup table for an opacity percentage."""
+    return [round(p * (opacity / 100)) for p in range(256)]
+
+
+@functools.lru_cache(maxsize=32)
+def _prepare_image_watermark(
+    watermark_path: str, new_width: int, opacity: int
+) -> Image.Image:
+    """
+    Loads, resizes and fades an image watermark for a given target width.
+
+    Results are cached, so a folder of same-width images resizes the logo
+    once. Callers must not modify the returned image.
+    """
+    with Image.open(watermark_path) as img_watermark:
+        img_watermark = img_watermark.convert("RGBA")
+        ratio = img_watermark.height / img_watermark.width
+        # reducing_gap lets Pillow shrink large logos with a cheap box reduce
+        # before the Lanczos pass, with no visible difference.
+        watermark = img_watermark.resize(
+            (new_width, int(new_width * ratio)),
+            Image.Resampling.LANCZOS,
+            reducing_gap=3.0,
+        )
+
+    if opacity < 100:
+        alpha = watermark.getchannel("A").point(_opacity_lut(opacity))
+        watermark.putalpha(alpha)
+    return watermark
+
+
+def encode_jpeg(image: Image.Image) -> io.BytesIO:
+    """
+    Encodes an RGB image as JPEG into an in-memory bytes object.
+
+    Uses libjpeg-turbo through PyTurboJPEG when it is available and falls back
+    to Pillow's encoder otherwise.
+
+    Args:
+        image (Image.Image): The RGB image to encode.
+
+    Returns:
+        io.BytesIO: The encoded image, rewound and named for upload.
+    """
+    if _turbo_jpeg is not None:
+        jpeg_bytes = _turbo_jpeg.encode(
+            np.asarray(image),
+            quality=JPEG_QUALITY,
+            jpeg_subsample=TJSAMP_420,
+            pixel_format=TJPF_RGB,
+        )
+        encoded = io.BytesIO(jpeg_bytes)
+    else:
+        scratch = getattr(_encode_buffers, "buffer", None)
+        if scratch is None:
+            scratch = _encode_buffers.buffer = io.BytesIO()
+        # Rewind without truncating; truncate() would release the capacity.
+        # Only the bytes written by this encode are copied out below.
+        scratch.seek(0)
+        # Optimized Huffman tables and progressive scans save a few percent of
+        # size at roughly twice the encode time, which isn't worth it here.
+        image.save(
+            scratch,
+            format="JPEG",
+            quality=JPEG_QUALITY,
+            subsampling="4:2:0",
+            optimize=False,
+            progressive=False,
+        )
+        # Telethon keeps the upload object around, so it gets its own copy.
+        with scratch.getbuffer() as view:
+            encoded = io.BytesIO(view[: scratch.tell()])
+
+    encoded.name = "watermarked.jpg"
+    return encoded
+
+
+def _open_base_image(image_path: str, max_dim: int) -> Image.Image:
+    """
+    Opens and decodes a source image as RGB, fitting it within `max_dim`.
+
+    Oversized sources are shrunk first so the watermark is sized, blended and
+    encoded at the resolution that will actually be shown. For JPEGs the
+    decoder is put in draft mode beforehand, so libjpeg already decodes at
+    1/2, 1/4 or 1/8 scale and far fewer pixels go through the IDCT.
+
+    Args:
+        image_path (str): File path to the source image.
+        max_dim (int): The longest allowed side in pixels, or 0 to keep the
+            original size.
+
+    Returns:
+        Image.Image: The decoded RGB image.
+    """
+    with Image.open(image_path) as source:
+        if max_dim > 0:
+            scale = max_dim / max(source.size)
+            if scale < 1:
+                # Draft mode only ever decodes at or above the requested size.
+                source.draft(
+                    "RGB",
+                    (math.ceil(source.width * scale), math.ceil(source.height * scale)),
+                )
+        base_image = source.convert("RGB")
+
+    if max_dim > 0:
+        base_image.thumbnail((max_dim, max_dim), Image.Resampling.LANCZOS)
+    return base_image
+
+
 def apply_watermark(
-    image_path: str, watermark_asset: str | Image.Image, options: dict
+    image_path: str, watermark_asset: str, options: dict
 ) -> io.BytesIO | None:
     """
     Applies a watermark (either an image or text) to a base image.
 
+    The base image is opened and decoded once; text watermarks are rendered
+    against its size. This is the CPU-bound part of the pipeline and is meant
+    to run in a worker thread, as Pillow releases the GIL while decoding,
+    compositing and encoding. Its arguments and result are picklable, so large
+    batches can run it in worker processes instead.
+
     Args:
         image_path (str): File path to the base image.
-        watermark_asset (str | Image.Image): Either a file path to the watermark image
-            or a pre-rendered Pillow Image object (for text watermarks).
-        options (dict): A dictionary containing customization settings.
+        watermark_asset (str): The watermark text, or the file path to the
+            watermark image, depending on `options["type"]`.
+        options (dict): A dictionary containing customization settings. A
+            positive `max_dim` downscales the image to fit within that size.
 
     Returns:
         io.BytesIO | None: An in-memory bytes object of the final watermarked image,
         or None if an error occurred.
     """
     try:
-        with Image.open(image_path).convert("RGBA") as base_image:
-            final_watermark: Image.Image
-
-            # Process image-based watermark.
-            if isinstance(watermark_asset, str):
-                with Image.open(watermark_asset).convert("RGBA") as img_watermark:
-                    ratio = img_watermark.height / img_watermark.width
-                    new_width = int(base_image.width * (options["scale"] / 100))
-                    final_watermark = img_watermark.resize(
-                        (new_width, int(new_width * ratio)), Image.Resampling.LANCZOS
-                    )
-                    if options["opacity"] < 100:
-                        alpha = final_watermark.getchannel("A").point(
-                            lambda p: p * (options["opacity"] / 100)
-                        )
-                        final_watermark.putalpha(alpha)
-            # Use the pre-rendered text watermark image.
+        with _open_base_image(image_path, options["max_dim"]) as base_image:
+            final_watermark: Image.Image | None
+
+            if options["type"] == "text":
+                final_watermark = create_text_watermark_image(
+                    watermark_asset,
+                    base_image.size,
+                    FONT_PATH,
+                    options["opacity"],
+                    options["scale"],
+                )
+                if not final_watermark:
+                    return None
             else:
-                final_watermark = watermark_asset
+                new_width = int(base_image.width * (options["scale"] / 100))
+                final_watermark = _prepare_image_watermark(
+                    watermark_asset, new_width, options["opacity"]
+                )
 
             # Determine position. Text watermark is always centered.
             padding = 10
@@ -150,20 +326,12 @@ def apply_watermark(
                 }
                 position = positions.get(options["position"], positions["1"])
 
-            # Composite the watermark onto the base image.
-            transparent_layer = Image.new("RGBA", base_image.size, (0, 0, 0, 0))
-            transparent_layer.paste(final_watermark, position, mask=final_watermark)
-            final_image = Image.alpha_composite(base_image, transparent_layer)
-
-            # Save the final image to an in-memory bytes object.
-            final_image_bytes = io.BytesIO()
-            final_image.convert("RGB").save(
-                final_image_bytes, format="JPEG", quality=95
-            )
-            final_image_bytes.seek(0)
-            final_image_bytes.name = "watermarked.jpg"
+            # The output is an opaque JPEG, so the base is kept as RGB and the
+            # watermark is blended in place through its own alpha mask. Only
+            # the region it covers is touched.
+            base_image.paste(final_watermark, position, mask=final_watermark)
 
-            return final_image_bytes
+            return encode_jpeg(base_image)
 
     except Exception as e:
         console.print(
@@ -175,6 +343,9 @@ def apply_watermark(
 async def run(client: TelegramClient):
     """
     Orchestrates applying a watermark to a folder of images and sending them.
+
+    Images are watermarked on a thread pool while earlier ones are uploaded,
+    and are sent to the chat as albums in folder order.
     """
     console.clear()
     console.print(
@@ -237,6 +408,11 @@ async def run(client: TelegramClient):
             "[bold]Watermark image opacity (1-100%)[/bold]", default=70
         )
 
+    watermark_options["max_dim"] = IntPrompt.ask(
+        "[bold]Downscale images larger than this many pixels (0 to keep original size)[/bold]",
+        default=DEFAULT_MAX_DIMENSION,
+    )
+
     target_chat = await select_chat(
         client, "Select the chat to send the watermarked images to:"
     )
@@ -244,11 +420,13 @@ async def run(client: TelegramClient):
         return
 
     # Find and process images.
-    image_files = [
-        f
-        for f in os.listdir(source_folder)
-        if f.lower().endswith((".png", ".jpg", ".jpeg"))
-    ]
+    with os.scandir(source_folder) as entries:
+        image_files = sorted(
+            entry.name
+            for entry in entries
+            if os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS
+            and entry.is_file()
+        )
     if not image_files:
         console.print(
             "[yellow]No image files (.png, .jpg, .jpeg) found in the specified folder.[/yellow]"
@@ -259,42 +437,94 @@ async def run(client: TelegramClient):
         f"\n[cyan]Found {len(image_files)} images. Preparing to process and upload...[/cyan]"
     )
 
-    with Progress(console=console) as progress:
-        task = progress.add_task("[purple]Processing images...", total=len(image_files))
+    loop = asyncio.get_running_loop()
+    workers = os.cpu_count() or 1
+    # Bounded so finished images waiting for upload don't pile up in memory.
+    encoded_queue: asyncio.Queue = asyncio.Queue(maxsize=2 * workers)
+    uploaded_count = 0
+
+    async def produce(executor: Executor):
+        """Schedules every image on the worker pool, in folder order."""
         for filename in image_files:
             image_path = os.path.join(source_folder, filename)
-            progress.update(
-                task, description=f"[purple]Processing '{filename}'[/purple]"
+            future = loop.run_in_executor(
+                executor,
+                apply_watermark,
+                image_path,
+                watermark_asset,
+                watermark_options,
             )
+            await encoded_queue.put((filename, future))
+        await encoded_queue.put(None)
+
+    async def upload(progress: Progress, task):
+        """Uploads finished images as albums, in their original order."""
+        album = []
 
-            watermark_to_apply = watermark_asset
-            if watermark_options["type"] == "text":
-                with Image.open(image_path) as img:
-                    watermark_to_apply = create_text_watermark_image(
-                        watermark_asset,
-                        img.size,
-                        FONT_PATH,
-                        watermark_options["opacity"],
-                        watermark_options["scale"],
-                    )
-                if not watermark_to_apply:
-                    continue
-
-            final_image_bytes = apply_watermark(
-                image_path, watermark_to_apply, watermark_options
+        async def send_album():
+            nonlocal uploaded_count
+            progress.update(
+                task, description=f"[purple]Uploading {len(album)} images[/purple]"
+            )
+            # Telethon sends any list as an album, so a lone image goes as a
+            # plain photo instead.
+            await client.send_file(
+                target_chat,
+                album if len(album) > 1 else album[0],
+                force_document=False,
+                caption="",
             )
+            uploaded_count += len(album)
+            progress.update(task, advance=len(album))
+            album.clear()
 
-            if final_image_bytes:
-                progress.update(
-                    task, description=f"[purple]Uploading '{filename}'[/purple]"
-                )
-                await client.send_file(
-                    target_chat, final_image_bytes, force_document=False, caption=""
-                )
+        while (item := await encoded_queue.get()) is not None:
+            filename, future = item
+            progress.update(
+                task, description=f"[purple]Processing '{filename}'[/purple]"
+            )
+            final_image_bytes = await future
+
+            if not final_image_bytes:
+                progress.update(task, advance=1)
+                continue
+
+            album.append(final_image_bytes)
+            if len(album) == ALBUM_SIZE:
+                await send_album()
+
+        if album:
+            await send_album()
+
+    # Watermarking runs on the worker pool while the previous images upload,
+    # so a batch takes roughly max(encode, upload) time instead of their sum.
+    # Large batches use processes, so the Python code between Pillow calls
+    # doesn't serialize on the GIL. They are spawned fresh rather than forked
+    # from a process running the client's event loop.
+    if len(image_files) >= PROCESS_POOL_FILES_PER_WORKER * workers:
+        executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    else:
+        executor = ThreadPoolExecutor(max_workers=workers)
 
-            progress.update(task, advance=1)
+    with executor, Progress(console=console) as progress:
+        task = progress.add_task("[purple]Processing images...", total=len(image_files))
+        producer = asyncio.create_task(produce(executor))
+        try:
+            await upload(progress, task)
+        finally:
+            # If an upload failed, stop scheduling work and drop the images
+            # still waiting in the queue, so the producer doesn't stay blocked
+            # on a full queue and the pool doesn't finish the whole batch.
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+            while not encoded_queue.empty():
+                if item := encoded_queue.get_nowait():
+                    item[1].cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
 
     console.print(f"\n[bold green]--- Process Complete ---[/bold green]")
     console.print(
-        f"Successfully processed and uploaded {len(image_files)} images to '{target_chat.name}'."
+        f"Successfully processed and uploaded {uploaded_count} images to '{target_chat.name}'."
     )
@@ -12,9 +12,33 @@ from telethon.tl.types import Dialog
 from rich.console import Console
 from rich.prompt import IntPrompt
 
+from utils.dialog_cache import get_dialogs_cached
+
 console = Console()
 
 
+def _match(dialog: Dialog, chat_type: str) -> bool:
+    """
+    Checks whether a dialog belongs to the requested chat type.
+
+    Args:
+        dialog (Dialog): The dialog to check.
+        chat_type (str): One of 'group', 'channel' or 'any'.
+
+    Returns:
+        bool: True if the dialog should be offered for selection.
+    """
+    if chat_type == "any":
+        return True
+    if chat_type == "group":
+        return dialog.is_group
+    if chat_type == "channel":
+        # Telegram considers "megagroups" as a type of channel, so we need to
+        # explicitly exclude them if we only want broadcast channels.
+        return dialog.is_channel and not getattr(dialog.entity, "megagroup", False)
+    return False
+
+
 async def select_chat(
     client: TelegramClient, title_prompt: str, chat_type: str = "any"
 ) -> Dialog | None:
@@ -32,22 +56,8 @@ async def select_chat(
         user's choice, or `None` if the operation is canceled or no chats are found.
     """
     console.print("[yellow]Loading chat list...[/yellow]")
-    dialogs = await client.get_dialogs()
-
-    chats = []
-    for d in dialogs:
-        # The filtering logic distinguishes groups from broadcast channels.
-        # Telegram considers "megagroups" as a type of channel, so we need to
-        # explicitly exclude them if we only want broadcast channels.
-        is_group = d.is_group
-        is_channel = d.is_channel and not getattr(d.entity, "megagroup", False)
-
-        if chat_type == "group" and is_group:
-            chats.append(d)
-        elif chat_type == "channel" and is_channel:
-            chats.append(d)
-        elif chat_type == "any":
-            chats.append(d)
+    dialogs = await get_dialogs_cached(client)
+    chats = [d for d in dialogs if _match(d, chat_type)]
 
     if not chats:
         console.print(
@@ -56,8 +66,7 @@ async def select_chat(
         return None
 
     console.print(f"\n[bold green]{title_prompt}[/bold green]")
-    for i, chat in enumerate(chats):
-        console.print(f"  [{i}] - {chat.name}")
+    console.print("\n".join(f"  [{i}] - {chat.name}" for i, chat in enumerate(chats)))
 
     while True:
         # The default value 'len(chats)' acts as an implicit "cancel" option,
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""
+Crypto Backend Check Utility - Teleforge
+
+This module verifies that `cryptg` is installed before the application
+connects to Telegram. Telethon detects `cryptg` on its own and uses it for
+MTProto's AES-IGE encryption; without it, every transferred byte goes
+through a far slower fallback, which is the main throughput limit for
+downloads and long message scans.
+"""
+import importlib.util
+import sys
+
+from rich.console import Console
+from rich.panel import Panel
+
+console = Console()
+
+
+def require_cryptg() -> None:
+    """
+    Exits the application with an explanatory panel if `cryptg` is missing.
+    """
+    if importlib.util.find_spec("cryptg") is None:
+        console.print(
+            Panel(
+                "[bold]The 'cryptg' package is not installed.[/bold]\n\n"
+                "Teleforge requires it for fast MTProto encryption. Install it with:\n"
+                "[yellow]pip install cryptg[/yellow]",
+                title="[bold red]Missing Dependency[/bold red]",
+                border_style="red",
+            )
+        )
+        sys.exit(1)
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+Dialog Cache Utility - Teleforge
+
+This module provides a small time-based cache for the user's dialog list.
+Fetching every dialog is a paginated sequence of API calls, and the main
+menu lets modules run many times per session, so repeated calls within a
+short window reuse the previous result instead of hitting Telegram again.
+"""
+import time
+
+from telethon.sync import TelegramClient
+from telethon.tl.custom import Dialog
+
+# Cached entries are stored on the client itself so the cache lives exactly
+# as long as the connection it was fetched with.
+_CACHE_ATTR = "_dialog_cache"
+
+
+async def get_dialogs_cached(client: TelegramClient, ttl: float = 60) -> list[Dialog]:
+    """
+    Returns the user's dialogs, reusing a recent fetch when one is available.
+
+    Args:
+        client (TelegramClient): The active and connected Telethon client instance.
+        ttl (float, optional): How long, in seconds, a fetched list stays valid.
+            Defaults to 60.
+
+    Returns:
+        list[Dialog]: The user's dialogs, as returned by `client.get_dialogs()`.
+    """
+    fetched_at, dialogs = getattr(client, _CACHE_ATTR, (0.0, None))
+    if dialogs is not None and time.monotonic() - fetched_at < ttl:
+        return dialogs
+
+    dialogs = await client.get_dialogs()
+    setattr(client, _CACHE_ATTR, (time.monotonic(), dialogs))
+    return dialogs
+
+
+def invalidate_dialog_cache(client: TelegramClient) -> None:
+    """
+    Forces the next `get_dialogs_cached` call to fetch a fresh dialog list.
+
+    Modules should call this after changing dialogs (archiving, leaving, etc.).
+
+    Args:
+        client (TelegramClient): The active and connected Telethon client instance.
+    """
+    if hasattr(client, _CACHE_ATTR):
+        setattr(client, _CACHE_ATTR, (0.0, None))
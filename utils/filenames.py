@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+Filename Utility - Teleforge
+
+This module provides a shared helper for turning chat and group names into
+safe file and folder names, so every module that writes to disk sanitizes
+names the same way.
+"""
+
+
+class _SanitizeTable(dict):
+    """
+    A `str.translate` table that keeps letters, digits, spaces and underscores.
+
+    The table is filled lazily: each code point is classified the first time it
+    is seen and cached, so later translations run entirely in C without having
+    to precompute an entry for every Unicode character.
+    """
+
+    def __missing__(self, codepoint: int) -> int | None:
+        char = chr(codepoint)
+        value = codepoint if char.isalnum() or char in " _" else None
+        self[codepoint] = value
+        return value
+
+
+_SANITIZE_TABLE = _SanitizeTable()
+
+
+def sanitize_filename(name: str) -> str:
+    """
+    Strips every character that is not a letter, digit, space or underscore.
+
+    Args:
+        name (str): The raw name, e.g. a chat title.
+
+    Returns:
+        str: The sanitized name, with trailing whitespace removed.
+    """
+    return name.translate(_SANITIZE_TABLE).rstrip()